@@ -1,30 +1,10 @@
 from __future__ import annotations
 
-import glob
-import platform
+import math
 import subprocess
 import sys
-from typing import Callable
-
-
-def is_mic_active() -> tuple[bool, str]:
-    """Return microphone activity status for the current OS."""
-    return _dispatch(
-        windows=_win_mic_active,
-        darwin=_mac_mic_active,
-        linux=_nix_mic_active,
-    )
-
-
-def _dispatch(**impl: Callable[[], tuple[bool, str]]) -> tuple[bool, str]:
-    osname = platform.system().lower()
-    if osname.startswith("win"):
-        return impl["windows"]()
-    if osname == "darwin":
-        return impl["darwin"]()
-    if osname == "linux":
-        return impl["linux"]()
-    return (False, "Not supported")
+import time
+from typing import Iterable, Iterator
 
 
 def _safe_run(cmd: list[str]) -> subprocess.CompletedProcess:
@@ -37,82 +17,591 @@ def _safe_run(cmd: list[str]) -> subprocess.CompletedProcess:
     )
 
 
+def _sleep_wait(timeout: float, poll_time: float) -> None:
+    time.sleep(min(timeout, poll_time))
+
+
 if sys.platform.startswith("win"):
+    import ctypes
     import winreg
+    from ctypes import wintypes
 
     _REG_PATH = r"SOFTWARE\Microsoft\Windows\CurrentVersion\CapabilityAccessManager\ConsentStore"
 
+    _REG_NOTIFY_CHANGE_NAME = 0x1
+    _REG_NOTIFY_CHANGE_LAST_SET = 0x4
+    _WAIT_OBJECT_0 = 0
+
+    _advapi32 = ctypes.WinDLL("advapi32")
+    _advapi32.RegNotifyChangeKeyValue.argtypes = [
+        wintypes.HKEY,
+        wintypes.BOOL,
+        wintypes.DWORD,
+        wintypes.HANDLE,
+        wintypes.BOOL,
+    ]
+    _advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _kernel32.CreateEventW.argtypes = [
+        wintypes.LPVOID,
+        wintypes.BOOL,
+        wintypes.BOOL,
+        wintypes.LPCWSTR,
+    ]
+    _kernel32.CreateEventW.restype = wintypes.HANDLE
+    _kernel32.ResetEvent.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+
+    # cap -> (consent store key, manual-reset event signalled on change)
+    _cap_watches: dict[str, tuple[winreg.HKEYType, int]] = {}
+    _cap_states: dict[str, tuple[bool, str]] = {}
+
+    def _cap_watch_arm(hkey: winreg.HKEYType, event: int) -> bool:
+        # one-shot: the event is signalled on the next change anywhere below hkey
+        return not _advapi32.RegNotifyChangeKeyValue(
+            hkey.handle,
+            True,
+            _REG_NOTIFY_CHANGE_NAME | _REG_NOTIFY_CHANGE_LAST_SET,
+            event,
+            True,
+        )
+
+    def _cap_changed(cap: str) -> bool:
+        """
+        Whether the consent store for *cap* may have changed since the last
+        call. Always True when the registry cannot be watched.
+        """
+        watch = _cap_watches.get(cap)
+        if watch is None:
+            try:
+                hkey = winreg.OpenKey(winreg.HKEY_CURRENT_USER, rf"{_REG_PATH}\{cap}")
+            except OSError:
+                return True
+            event = _kernel32.CreateEventW(None, True, False, None)
+            if not event:
+                hkey.Close()
+                return True
+            if _cap_watch_arm(hkey, event):
+                _cap_watches[cap] = (hkey, event)
+            else:
+                hkey.Close()
+                _kernel32.CloseHandle(event)
+            return True
+        hkey, event = watch
+        if _kernel32.WaitForSingleObject(event, 0) != _WAIT_OBJECT_0:
+            return False
+        # re-arm before the caller re-scans so no change slips through
+        _kernel32.ResetEvent(event)
+        if not _cap_watch_arm(hkey, event):
+            del _cap_watches[cap]
+            hkey.Close()
+            _kernel32.CloseHandle(event)
+        return True
+
+    # subkey path -> (key last-write time, whether it was active then)
+    _reg_cache: dict[str, tuple[int, bool]] = {}
+    # key path -> (monotonic time, subkey names); re-enumerated on expiry
+    # while unwatched, and after every change reported by the watch
+    _subkey_names_cache: dict[str, tuple[float, list[str]]] = {}
+    _SUBKEY_NAMES_TTL = 5.0
+
     def _win_cap_active(cap: str) -> tuple[bool, str]:
         """
         Check CapabilityAccessManager usage counters.
         A value `LastUsedTimeStart` > `LastUsedTimeStop`
         means the capability is in use *right now*.
         """
-        try:
-            with winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, rf"{_REG_PATH}\{cap}"
-            ) as root:
-                for idx in range(winreg.QueryInfoKey(root)[0]):
-                    sub = winreg.EnumKey(root, idx)
-                    with winreg.OpenKey(root, sub) as key:
-                        if _subkeys_active(key):
-                            return (True, sub)
-            with winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, rf"{_REG_PATH}\{cap}\NonPackaged"
-            ) as root:
-                # packaged & non-packaged subkeys live one level deeper
-                for idx in range(winreg.QueryInfoKey(root)[0]):
-                    sub = winreg.EnumKey(root, idx)
-                    with winreg.OpenKey(root, sub) as key:
-                        if _subkeys_active(key):
+        path = rf"{_REG_PATH}\{cap}"
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, path) as root:
+            for parent, parent_path, sub in _app_subkeys(root, path):
+                try:
+                    with winreg.OpenKey(parent, sub) as key:
+                        if _subkeys_active(key, rf"{parent_path}\{sub}"):
                             return (True, sub)
+                except FileNotFoundError:
+                    # removed since it was enumerated
+                    _subkey_names_cache.pop(parent_path, None)
+        return (False, "off")
 
-        except OSError as e:
-            print(f"winreg error: {e}")
+    def _app_subkeys(
+        root: winreg.HKEYType, path: str
+    ) -> Iterator[tuple[winreg.HKEYType, str, str]]:
+        """
+        Yield (parent key, parent path, subkey name) for every per-app key
+        of the consent store at *root*, packaged first, then NonPackaged.
+        Only per-app keys carry usage timestamps, so NonPackaged itself
+        is not yielded.
+        """
+        names = _subkey_names(root, path)
+        for sub in names:
+            if sub != "NonPackaged":
+                yield root, path, sub
+        # not every install has it
+        if "NonPackaged" not in names:
+            return
+        try:
+            nonpackaged = winreg.OpenKey(root, "NonPackaged")
+        except FileNotFoundError:
+            _subkey_names_cache.pop(path, None)
+            return
+        path = rf"{path}\NonPackaged"
+        with nonpackaged:
+            # packaged & non-packaged subkeys live one level deeper
+            for sub in _subkey_names(nonpackaged, path):
+                yield nonpackaged, path, sub
 
-        return (False, "off")
+    def _subkey_names(root: winreg.HKEYType, path: str) -> list[str]:
+        now = time.monotonic()
+        cached = _subkey_names_cache.get(path)
+        if cached is None or now - cached[0] > _SUBKEY_NAMES_TTL:
+            names = [
+                winreg.EnumKey(root, idx) for idx in range(winreg.QueryInfoKey(root)[0])
+            ]
+            cached = _subkey_names_cache[path] = (now, names)
+        return cached[1]
 
-    def _subkeys_active(hkey) -> bool:
+    def _subkeys_active(hkey, path: str) -> bool:
+        # A key's last-write time advances whenever one of its values is set,
+        # so one QueryInfoKey tells whether Start/Stop need re-reading.
+        last_write = winreg.QueryInfoKey(hkey)[2]
+        cached = _reg_cache.get(path)
+        if cached is not None and cached[0] == last_write:
+            return cached[1]
         try:
             start, _ = winreg.QueryValueEx(hkey, "LastUsedTimeStart")
             stop, _ = winreg.QueryValueEx(hkey, "LastUsedTimeStop")
             # both are Windows FILETIME (100-ns since 1601-01-01); 0 means never
-            return start > stop
+            active = start > stop
         except FileNotFoundError:
-            return False
+            active = False
+        _reg_cache[path] = (last_write, active)
+        return active
 
     def _win_mic_active() -> tuple[bool, str]:
-        return _win_cap_active("microphone")
+        if _cap_changed("microphone") or "microphone" not in _cap_states:
+            if "microphone" in _cap_watches:
+                # the change may be a new app key; don't scan stale names
+                _subkey_names_cache.clear()
+            try:
+                _cap_states["microphone"] = _win_cap_active("microphone")
+            except OSError as e:
+                print(f"winreg error: {e}")
+                # don't cache a failed scan; the next call rescans
+                _cap_states.pop("microphone", None)
+                return (False, "off")
+        return _cap_states["microphone"]
+
+    def _win_wait(timeout: float, poll_time: float) -> None:
+        watch = _cap_watches.get("microphone")
+        if watch is None or "microphone" not in _cap_states:
+            # unwatched, or the last scan failed and must be retried
+            _sleep_wait(timeout, poll_time)
+            return
+        # the event stays signalled until _win_mic_active resets it; wait at
+        # most 1 s at a time since Ctrl+C can't interrupt a blocking ctypes call
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            wait_ms = math.ceil(min(remaining, 1.0) * 1000)
+            if _kernel32.WaitForSingleObject(watch[1], wait_ms) == _WAIT_OBJECT_0:
+                return
+
+
+if sys.platform == "darwin":
+    import ctypes
+    import errno
+    import struct
+
+    # <sys/proc_info.h>
+    _PROC_ALL_PIDS = 1
+    _PROC_PIDLISTFDS = 1
+    _PROC_PIDFDVNODEPATHINFO = 2
+    _PROX_FDTYPE_VNODE = 1
+    # sizeof(struct vnode_fdinfowithpath), offsetof(..., pvip.vip_path)
+    _VNODE_FDINFO_SIZE = 1200
+    _VNODE_PATH_OFFSET = 176
+    # coreaudiod is a launchd daemon, so its PID is stable (seconds)
+    _COREAUDIOD_PID_TTL = 60.0
+    # lsof fallback: fork+exec costs tens of ms, so run it at most this
+    # often (seconds) and report the last result in between
+    _LSOF_INTERVAL = 5.0
 
+    try:
+        _libproc = ctypes.CDLL("/usr/lib/libproc.dylib", use_errno=True)
+    except OSError:
+        _libproc = None
+    else:
+        # <libproc.h>
+        _libproc.proc_listpids.argtypes = [
+            ctypes.c_uint32,
+            ctypes.c_uint32,
+            ctypes.c_void_p,
+            ctypes.c_int,
+        ]
+        _libproc.proc_listpids.restype = ctypes.c_int
+        _libproc.proc_name.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32]
+        _libproc.proc_name.restype = ctypes.c_int
+        _libproc.proc_pidinfo.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint64,
+            ctypes.c_void_p,
+            ctypes.c_int,
+        ]
+        _libproc.proc_pidinfo.restype = ctypes.c_int
+        _libproc.proc_pidfdinfo.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+        ]
+        _libproc.proc_pidfdinfo.restype = ctypes.c_int
 
-def _mac_mic_active() -> tuple[bool, str]:
-    """
-    Quick heuristic: list open CoreAudio capture streams.
-    We call `lsof -Fn -c coreaudiod` (no sudo needed);
-    presence of any /dev/audio or /dev/*input* node implies use.
-    """
-    out = _safe_run(["lsof", "-Fn", "-c", "coreaudiod"])
-    if out.returncode:
+    _coreaudiod_pid: int | None = None
+    _coreaudiod_pid_ts = float("-inf")
+    _lsof_state: tuple[bool, str] = (False, "off")
+    _lsof_ts = float("-inf")
+
+    def _find_pid(name: bytes) -> int | None:
+        if _libproc is None:
+            out = _safe_run(["pgrep", "-x", name.decode()])
+            if out.returncode:
+                return None
+            return int(out.stdout.split()[0])
+        size = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, None, 0)
+        if size <= 0:
+            return None
+        # leave room for processes spawned between the two calls
+        pids = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int) + 64))()
+        size = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+        buf = ctypes.create_string_buffer(256)
+        for pid in pids[: size // ctypes.sizeof(ctypes.c_int)]:
+            if pid and _libproc.proc_name(pid, buf, ctypes.sizeof(buf)) > 0:
+                if buf.value == name:
+                    return pid
+        return None
+
+    def _get_coreaudiod_pid() -> int | None:
+        global _coreaudiod_pid, _coreaudiod_pid_ts
+        now = time.monotonic()
+        if now - _coreaudiod_pid_ts > _COREAUDIOD_PID_TTL:
+            _coreaudiod_pid = _find_pid(b"coreaudiod")
+            _coreaudiod_pid_ts = now
+        return _coreaudiod_pid
+
+    def _vnode_paths(pid: int) -> list[bytes] | None:
+        """Paths of the vnodes *pid* holds open, or None if not readable."""
+        size = _libproc.proc_pidinfo(pid, _PROC_PIDLISTFDS, 0, None, 0)
+        if size <= 0:
+            return None
+        fds = ctypes.create_string_buffer(size)
+        size = _libproc.proc_pidinfo(pid, _PROC_PIDLISTFDS, 0, fds, size)
+        if size <= 0:
+            return None
+        info = ctypes.create_string_buffer(_VNODE_FDINFO_SIZE)
+        paths = []
+        # struct proc_fdinfo { int32_t proc_fd; uint32_t proc_fdtype; }
+        for fd, fdtype in struct.iter_unpack("iI", fds.raw[: size - size % 8]):
+            if fdtype != _PROX_FDTYPE_VNODE:
+                continue
+            got = _libproc.proc_pidfdinfo(
+                pid, fd, _PROC_PIDFDVNODEPATHINFO, info, _VNODE_FDINFO_SIZE
+            )
+            if got == _VNODE_FDINFO_SIZE:
+                paths.append(
+                    ctypes.string_at(ctypes.addressof(info) + _VNODE_PATH_OFFSET)
+                )
+        return paths
+
+    def _mac_lsof_active() -> tuple[bool, str]:
+        global _lsof_state, _lsof_ts
+        now = time.monotonic()
+        if now - _lsof_ts >= _LSOF_INTERVAL:
+            _lsof_state = _mac_lsof_check()
+            _lsof_ts = now
+        return _lsof_state
+
+    def _mac_lsof_check() -> tuple[bool, str]:
+        """
+        Quick heuristic: list open CoreAudio capture streams.
+        We call `lsof -Fn -p <coreaudiod pid>` (no sudo needed);
+        presence of any /dev/audio or /dev/*input* node implies use.
+        """
+        global _coreaudiod_pid_ts
+        pid = _get_coreaudiod_pid()
+        if pid is None:
+            return (False, "off")
+        out = _safe_run(["lsof", "-Fn", "-p", str(pid)])
+        if out.returncode:
+            # coreaudiod may have been respawned; look the PID up again next time
+            _coreaudiod_pid_ts = float("-inf")
+            return (False, "off")
+        if any("/dev/" in line for line in out.stdout.splitlines()):
+            return (True, "Active")
         return (False, "off")
-    if any("/dev/" in line for line in out.stdout.splitlines()):
-        return (True, "Active")
-    return (False, "off")
-
-
-def _nix_mic_active() -> tuple[bool, str]:
-    """
-    ALSA exposes stream state under
-    /proc/asound/card*/pcm*/sub0/status.
-    A line 'state: RUNNING' denotes capture in progress.
-    """
-    for status_file in glob.glob("/proc/asound/card*/pcm*/sub0/status"):
+
+    def _mac_mic_active() -> tuple[bool, str]:
+        """
+        Same heuristic as _mac_lsof_active, but asks libproc directly for
+        the vnodes coreaudiod holds open instead of spawning lsof.
+        """
+        global _coreaudiod_pid_ts
+        if _libproc is None:
+            return _mac_lsof_active()
+        pid = _get_coreaudiod_pid()
+        if pid is None:
+            return (False, "off")
+        paths = _vnode_paths(pid)
+        if paths is None:
+            if ctypes.get_errno() == errno.ESRCH:
+                # coreaudiod was respawned; look the PID up again next time
+                _coreaudiod_pid_ts = float("-inf")
+            return (False, "off")
+        if any(b"/dev/" in path for path in paths):
+            return (True, "Active")
+        return (False, "off")
+
+
+if sys.platform.startswith("linux"):
+    import atexit
+    import ctypes
+    import errno
+    import os
+    import re
+    import select
+    import struct
+
+    # inotify(7) event masks
+    _IN_CLOSE_WRITE = 0x008
+    _IN_CLOSE_NOWRITE = 0x010
+    _IN_OPEN = 0x020
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+    _IN_Q_OVERFLOW = 0x4000
+    # struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+    _INOTIFY_EVENT = struct.Struct("iIII")
+
+    # procfs never emits inotify events, so the status files cannot be
+    # watched directly. A substream leaves "closed" only when its ALSA device
+    # node is opened, so an open/close (or a hot-plugged card) under /dev/snd
+    # is our hint to re-read it. Once open, it can be prepared, started and
+    # stopped without further events, so open substreams are re-read on
+    # every poll.
+    _SND_DEV_DIR = "/dev/snd"
+    _ASOUND_DIR = "/proc/asound"
+    _SND_DEV_MASK = (
+        _IN_OPEN | _IN_CLOSE_WRITE | _IN_CLOSE_NOWRITE | _IN_CREATE | _IN_DELETE
+    )
+    # capture device node /dev/snd/pcmC<card>D<device>c
+    _CAPTURE_NODE = re.compile(rb"pcmC(\d+)D(\d+)c")
+    # Card topology rarely changes, so the status file list is rescanned
+    # at most this often (seconds).
+    _STATUS_PATHS_TTL = 60.0
+
+    # The kernel prints the state on the first line of each status file
+    # ("closed" when idle), so only that prefix needs to be read.
+    _RUNNING = b"state: RUNNING"
+    _CLOSED = b"closed"
+    # all capture status files, rescanned on expiry or hot-plug
+    _STATUS_PATHS: set[str] = set()
+    _STATUS_PATHS_TS = float("-inf")
+    # Status files of open (not "closed") substreams, kept open and
+    # re-sampled with pread(2). An open /proc/asound file pins the card's
+    # driver module, so closed substreams are not held open; that would
+    # make `modprobe -r` fail for as long as the watcher runs.
+    _STATUS_FDS: dict[str, int] = {}
+
+    _inotify_fd: int | None = None
+    _inotify_poll: select.poll | None = None
+
+    def _inotify_open() -> int | None:
+        """Watch /dev/snd; return the inotify fd or None if unavailable."""
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+        except OSError:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, _SND_DEV_DIR.encode(), _SND_DEV_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _inotify_read() -> set[str] | None:
+        """
+        Drain pending events in bulk and return the status files of the
+        capture devices they touched, or None if a full re-read is needed
+        (capture device added/removed, or the event queue overflowed).
+        """
+        global _STATUS_PATHS_TS
+        touched: set[str] | None = set()
+        # Most calls find nothing pending; checking readiness first keeps
+        # that path to a single poll(2) without raising BlockingIOError.
+        while _inotify_poll.poll(0):
+            buf = os.read(_inotify_fd, 65536)
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                match = _CAPTURE_NODE.match(buf, offset, offset + length)
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    touched = None
+                elif match is None:
+                    continue
+                elif mask & (_IN_CREATE | _IN_DELETE):
+                    if mask & _IN_DELETE:
+                        # let the card's driver go right away
+                        _close_status_fd(_capture_status_path(match))
+                    # topology changed; rescan the status files too
+                    _STATUS_PATHS_TS = float("-inf")
+                    touched = None
+                elif touched is not None:
+                    touched.add(_capture_status_path(match))
+        return touched
+
+    def _capture_status_path(node: re.Match) -> str:
+        card, device = (int(n) for n in node.groups())
+        return f"{_ASOUND_DIR}/card{card}/pcm{device}c/sub0/status"
+
+    def _capture_status_paths() -> set[str]:
+        """
+        /proc/asound/card*/pcm*c/sub0/status, listed with os.scandir (one
+        getdents64 per directory) instead of glob's fnmatch matching.
+        """
+        paths = set()
         try:
-            with open(status_file) as fh:
-                if "state: RUNNING" in fh.read():
-                    return (True, "Active")
+            cards = os.scandir(_ASOUND_DIR)
         except FileNotFoundError:
-            continue
-    return (False, "off")
+            return paths
+        with cards:
+            for card in cards:
+                # skips "cards" and the card-id symlinks to card<N>
+                if not (card.name.startswith("card") and card.name[4:].isdigit()):
+                    continue
+                try:
+                    pcms = os.scandir(card.path)
+                except FileNotFoundError:
+                    continue
+                with pcms:
+                    for pcm in pcms:
+                        if pcm.name.startswith("pcm") and pcm.name.endswith("c"):
+                            paths.add(f"{pcm.path}/sub0/status")
+        return paths
+
+    def _status_paths() -> set[str]:
+        """Return all ALSA capture status files, rescanning on expiry."""
+        global _STATUS_PATHS, _STATUS_PATHS_TS
+        now = time.monotonic()
+        if now - _STATUS_PATHS_TS > _STATUS_PATHS_TTL:
+            _STATUS_PATHS = _capture_status_paths()
+            for path in [p for p in _STATUS_FDS if p not in _STATUS_PATHS]:
+                _close_status_fd(path)
+            _STATUS_PATHS_TS = now
+        return _STATUS_PATHS
+
+    def _close_status_fd(path: str) -> None:
+        fd = _STATUS_FDS.pop(path, None)
+        if fd is not None:
+            os.close(fd)
+
+    def _close_status_fds() -> None:
+        while _STATUS_FDS:
+            os.close(_STATUS_FDS.popitem()[1])
+
+    def _read_status(path: str) -> bool:
+        """
+        Whether the substream of the status file at *path* is RUNNING.
+        Its fd is kept open while the substream is open and closed with it.
+        """
+        global _STATUS_PATHS_TS
+        fd = _STATUS_FDS.pop(path, None)
+        try:
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+            status = os.pread(fd, len(_RUNNING), 0)
+        except OSError as e:
+            if fd is not None:
+                os.close(fd)
+            # card went away; rescan on the next call
+            if e.errno not in (errno.ENOENT, errno.EIO, errno.ENODEV):
+                raise
+            _STATUS_PATHS_TS = float("-inf")
+            return False
+        if status.startswith(_CLOSED):
+            os.close(fd)
+            return False
+        _STATUS_FDS[path] = fd
+        return status == _RUNNING
+
+    def _nix_read_states(paths: Iterable[str]) -> tuple[bool, str]:
+        """Re-read *paths* (all of them, to keep _STATUS_FDS current)."""
+        running = False
+        for path in paths:
+            running = _read_status(path) or running
+        if running:
+            return (True, "Active")
+        return (False, "off")
+
+    def _nix_mic_active() -> tuple[bool, str]:
+        """
+        ALSA exposes stream state under
+        /proc/asound/card*/pcm*c/sub0/status (capture streams only).
+        A first line 'state: RUNNING' denotes capture in progress.
+        Only open substreams and capture devices opened/closed under /dev/snd
+        since the last call are re-read; without inotify every call re-reads
+        everything.
+        """
+        touched = None if _inotify_fd is None else _inotify_read()
+        if touched is None or time.monotonic() - _STATUS_PATHS_TS > _STATUS_PATHS_TTL:
+            # first call, hot-plug, lost events or the periodic rescan
+            return _nix_read_states(_status_paths())
+        # a substream only leaves "closed" with an open of its device node
+        return _nix_read_states(touched.union(_STATUS_FDS))
+
+    def _nix_wait(timeout: float, poll_time: float) -> None:
+        if _inotify_poll is None:
+            _sleep_wait(timeout, poll_time)
+            return
+        if _STATUS_FDS:
+            # an open substream can start or stop without a /dev/snd event
+            timeout = min(timeout, poll_time)
+        _inotify_poll.poll(math.ceil(timeout * 1000))
+
+    atexit.register(_close_status_fds)
+    _inotify_fd = _inotify_open()
+    if _inotify_fd is not None:
+        _inotify_poll = select.poll()
+        _inotify_poll.register(_inotify_fd, select.POLLIN)
+
+
+def _unsupported_mic_active() -> tuple[bool, str]:
+    return (False, "Not supported")
+
+
+# is_mic_active() -> (active, name): microphone activity status for the
+# current OS, bound once at import.
+# wait_for_change(timeout, poll_time): block until the status may have
+# changed or *timeout* seconds pass; backends without change notifications
+# just sleep for at most *poll_time*.
+if sys.platform.startswith("win"):
+    is_mic_active = _win_mic_active
+    wait_for_change = _win_wait
+elif sys.platform == "darwin":
+    is_mic_active = _mac_mic_active
+    wait_for_change = _sleep_wait
+elif sys.platform.startswith("linux"):
+    is_mic_active = _nix_mic_active
+    wait_for_change = _nix_wait
+else:
+    is_mic_active = _unsupported_mic_active
+    wait_for_change = _sleep_wait
 
 
 # ----------------------------  self-test  ---------------------------- #
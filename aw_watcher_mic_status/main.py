@@ -3,23 +3,29 @@
 import sys
 import logging
 import traceback
-from time import sleep
+from time import monotonic
 from datetime import datetime, timezone
 
 from aw_core import dirs
 from aw_core.models import Event
 from aw_client.client import ActivityWatchClient
 
-from .helper.mic_checker import is_mic_active
+from .helper.mic_checker import is_mic_active, wait_for_change
 
 
 class StatusLinePrinter:
-    _last_msg_length = 0
+    _last_msg = ""
+
+    def __init__(self) -> None:
+        # nobody sees a status line when running under aw-qt, systemd, etc.
+        self._enabled = sys.stdout is not None and sys.stdout.isatty()
 
     def print(self, msg: str) -> None:
-        print(" " * self._last_msg_length, end="\r")
-        print(msg, end="\r")
-        self._last_msg_length = len(msg)
+        if not self._enabled or msg == self._last_msg:
+            return
+        sys.stdout.write(" " * len(self._last_msg) + "\r" + msg + "\r")
+        sys.stdout.flush()
+        self._last_msg = msg
 
 
 printer = StatusLinePrinter()
@@ -31,6 +37,7 @@ logger = logging.getLogger(watcher_name)
 DEFAULT_CONFIG = f"""
 [{watcher_name}]
 poll_time = 0.5
+keepalive_time = 10.0
 """
 
 
@@ -51,6 +58,9 @@ def main():
         print("poll_time is not set in the config file.")
         print(f"You can set it in {config_dir}")
         sys.exit(1)
+    # Heartbeats are only sent when the state changes, and otherwise
+    # repeated at this interval to keep the current event open.
+    keepalive_time = float(config[watcher_name].get("keepalive_time", 10.0))
 
     # TODO: Fix --testing flag and set testing as appropriate
     aw = ActivityWatchClient(watcher_name, testing=False)
@@ -63,24 +73,45 @@ def main():
     # If the action takes longer than this, the event will be split into multiple events.
     # Make sure to make this number as big as needed to make sure that the event is not split.
     max_action_time = 0.5
+    # a keepalive can be up to one poll_time late, see the wait below
+    pulsetime = keepalive_time + poll_time + max_action_time
+
+    last_status = None
+    data = None
+    last_heartbeat = float("-inf")
 
     while True:
 
         try:
-            title = "Mic off"
-            state, name = is_mic_active()
-            if state:
-                title = "Mic on"
-            data = {"title": title, "active_name": name}
-            printer.print(name)
-            event = Event(timestamp=datetime.now(timezone.utc), data=data)
-            aw.heartbeat(
-                bucketname, event, pulsetime=poll_time + max_action_time, queued=True
-            )
+            status = is_mic_active()
+            printer.print(status[1])
+            changed = status != last_status
+            now = monotonic()
+            if changed or now - last_heartbeat >= keepalive_time:
+                timestamp = datetime.now(timezone.utc)
+                if changed and data is not None:
+                    # extend the previous event up to the moment it changed
+                    event = Event(timestamp=timestamp, data=data)
+                    aw.heartbeat(bucketname, event, pulsetime=pulsetime, queued=True)
+                if changed:
+                    # only build a new data dict when there is something new
+                    state, name = status
+                    title = "Mic off"
+                    if state:
+                        title = "Mic on"
+                    data = {"title": title, "active_name": name}
+                    last_status = status
+                event = Event(timestamp=timestamp, data=data)
+                aw.heartbeat(bucketname, event, pulsetime=pulsetime, queued=True)
+                last_heartbeat = now
         except Exception as e:
             print("An exception occurred: {}".format(e))
             traceback.print_exc()
-        sleep(poll_time)
+        # Sleep until the next keepalive is due, but wake up early when the
+        # OS reports a possible change (macOS just polls every poll_time).
+        wait_for_change(
+            max(poll_time, last_heartbeat + keepalive_time - monotonic()), poll_time
+        )
 
 
 if __name__ == "__main__":